@@ -9,6 +9,45 @@ import os
 import argparse
 from pathlib import Path
 
+# Stub README written for every new chapter
+CHAPTER_README_TEMPLATE = (
+    "# {chapter_name}\n\n"
+    "This is the content for Chapter {chapter_number}: {chapter_name}.\n\n"
+    "## Overview\n\n"
+    "Write your chapter overview here.\n"
+)
+
+# Stub written for each section file requested with --sections
+SECTION_TEMPLATE = (
+    "# {section_name}\n\n"
+    "This is a section in Chapter {chapter_number}: {chapter_name}.\n\n"
+    "Write your section content here.\n"
+)
+
+def scan_max_chapter_number(chapters_dir):
+    """Return the highest number prefix among existing chapter directories, or 0."""
+    numbers = []
+    for chapter in chapters_dir.iterdir():
+        if not chapter.is_dir():
+            continue
+        try:
+            # Extract number from directory name (e.g., "01-introduction" → 1)
+            numbers.append(int(chapter.name.split('-')[0]))
+        except (ValueError, IndexError):
+            pass
+    
+    return max(numbers, default=0)
+
+def write_bytes(path, data):
+    """Write data to path with raw os.write calls, bypassing the text I/O layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 def create_chapter(book_root, chapter_name, chapter_number=None, sections=None):
     """
     Create a new chapter directory with README.md and optional section files.
@@ -19,7 +58,7 @@ def create_chapter(book_root, chapter_name, chapter_number=None, sections=None):
         chapter_number: Chapter number (for ordering)
         sections: List of section names to create
     """
-    book_root = Path(book_root).resolve()
+    book_root = Path(os.path.abspath(book_root))
     chapters_dir = book_root / 'chapters'
     
     # Create chapters directory if it doesn't exist
@@ -29,21 +68,7 @@ def create_chapter(book_root, chapter_name, chapter_number=None, sections=None):
     
     # Determine chapter number if not provided
     if chapter_number is None:
-        existing_chapters = [d for d in chapters_dir.iterdir() if d.is_dir()]
-        if existing_chapters:
-            # Extract numbers from existing chapter directories
-            numbers = []
-            for chapter in existing_chapters:
-                try:
-                    # Extract number from directory name (e.g., "01-introduction" → 1)
-                    num = int(chapter.name.split('-')[0])
-                    numbers.append(num)
-                except (ValueError, IndexError):
-                    pass
-            
-            chapter_number = max(numbers) + 1 if numbers else 1
-        else:
-            chapter_number = 1
+        chapter_number = scan_max_chapter_number(chapters_dir) + 1
     
     # Format chapter number with leading zeros
     formatted_number = f"{chapter_number:02d}"
@@ -63,25 +88,26 @@ def create_chapter(book_root, chapter_name, chapter_number=None, sections=None):
     
     # Create README.md with chapter title
     readme_path = chapter_dir / 'README.md'
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {chapter_name}\n\n")
-        f.write(f"This is the content for Chapter {chapter_number}: {chapter_name}.\n\n")
-        f.write("## Overview\n\n")
-        f.write("Write your chapter overview here.\n")
+    readme_path.write_text(CHAPTER_README_TEMPLATE.format(chapter_name=chapter_name, chapter_number=chapter_number),
+                           encoding='utf-8')
     
     print(f"Created chapter README at {readme_path}")
     
     # Create section files if provided
     if sections:
+        # Everything but the section title is the same for every file, so
+        # render and encode it once and write raw bytes per section
+        head, tail = SECTION_TEMPLATE.split('{section_name}', 1)
+        head = head.encode('utf-8')
+        tail = tail.format(chapter_number=chapter_number, chapter_name=chapter_name).encode('utf-8')
+        chapter_dir_str = str(chapter_dir)
+        
         for i, section_name in enumerate(sections, 1):
             # Format section name for filename
             formatted_section_name = section_name.lower().replace(' ', '-')
-            section_path = chapter_dir / f"{i:02d}-{formatted_section_name}.md"
+            section_path = os.path.join(chapter_dir_str, f"{i:02d}-{formatted_section_name}.md")
             
-            with open(section_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {section_name}\n\n")
-                f.write(f"This is a section in Chapter {chapter_number}: {chapter_name}.\n\n")
-                f.write("Write your section content here.\n")
+            write_bytes(section_path, head + section_name.encode('utf-8') + tail)
             
             print(f"Created section file at {section_path}")
     
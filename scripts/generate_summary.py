@@ -9,16 +9,21 @@ import os
 import re
 from pathlib import Path
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Default exclude patterns that only inspect the file name, mapped to the
+# equivalent str.startswith prefix or exact name
+_NAME_PREFIX_EXCLUDES = {r'/\.': '.', r'/_': '_'}
+_NAME_EQUALS_EXCLUDES = {r'node_modules': 'node_modules', r'book$': 'book', r'SUMMARY\.md$': 'SUMMARY.md'}
 
 def extract_title(file_path):
     """Extract the title from a markdown file (first # heading)."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Look for the first heading
-            match = re.search(r'^# (.+)$', content, re.MULTILINE)
-            if match:
-                return match.group(1)
+            # Chapter files always open with an ATX "# Title" line
+            first = f.readline()
+            if first.startswith('# '):
+                return first[2:].rstrip()
             
             # If no heading found, use the filename without extension
             return os.path.splitext(os.path.basename(file_path))[0].replace('-', ' ').title()
@@ -26,12 +31,43 @@ def extract_title(file_path):
         print(f"Warning: Could not extract title from {file_path}: {e}")
         return os.path.splitext(os.path.basename(file_path))[0].replace('-', ' ').title()
 
-def is_excluded(path, exclude_patterns):
-    """Check if the path matches any exclusion pattern."""
-    for pattern in exclude_patterns:
-        if re.search(pattern, str(path)):
-            return True
-    return False
+def compile_excludes(patterns):
+    """
+    Split exclusion patterns into cheap file-name checks and residual regexes.
+    
+    The default patterns only ever look at the last path component, so they are
+    turned into prefix/equality tests. Anything else is compiled on its own:
+    joining user patterns into one alternation would break inline global flags
+    such as (?i) and renumber their backreferences.
+    """
+    prefixes, names, residual = [], set(), []
+    for pattern in patterns:
+        if pattern in _NAME_PREFIX_EXCLUDES:
+            prefixes.append(_NAME_PREFIX_EXCLUDES[pattern])
+        elif pattern in _NAME_EQUALS_EXCLUDES:
+            names.add(_NAME_EQUALS_EXCLUDES[pattern])
+        else:
+            residual.append(re.compile(pattern))
+    
+    return tuple(prefixes), names, residual
+
+def is_excluded(path, exclude):
+    """Check if the path matches the exclusion rules built by compile_excludes."""
+    prefixes, names, residual = exclude
+    name = os.path.basename(path)
+    return (name.startswith(prefixes) or name in names
+            or any(p.search(path) for p in residual))
+
+def relative_path(path, root_prefix):
+    """Return path relative to the book root as a forward-slash link target."""
+    return path[len(root_prefix):].replace(os.sep, '/')
+
+def list_markdown_files(directory, exclude_re, skip=()):
+    """Return the paths of markdown files directly inside directory, sorted by name."""
+    with os.scandir(directory) as it:
+        return sorted(e.path for e in it
+                      if e.name.endswith('.md') and e.name not in skip
+                      and e.is_file() and not is_excluded(e.path, exclude_re))
 
 def generate_summary(book_root, output_file, exclude=None, indent_level=0):
     """
@@ -40,64 +76,73 @@ def generate_summary(book_root, output_file, exclude=None, indent_level=0):
     if exclude is None:
         exclude = [r'/\.', r'/_', r'node_modules', r'book$', r'SUMMARY\.md$']
     
-    book_root = Path(book_root).resolve()
+    exclude = compile_excludes(exclude)
+    
+    book_root = Path(os.path.abspath(book_root))
     chapters_dir = book_root / 'chapters'
+    # Every path we emit is built under book_root, so slicing off this prefix
+    # is equivalent to relative_to() without the per-component comparison
+    root_prefix = os.path.join(book_root, '')
     
-    # Start with the title
-    content = ["# Summary\n\n"]
+    # First pass: walk the tree and record every entry in output order as
+    # (indent, title, path). A title of None means it must be read from path.
+    entries = []
     
     # Add README.md (introduction) if it exists
-    readme_path = book_root / 'README.md'
-    if readme_path.exists():
-        title = extract_title(readme_path)
-        content.append(f"* [{title}](README.md)\n")
+    readme_path = os.path.join(book_root, 'README.md')
+    if os.path.exists(readme_path):
+        entries.append(("", None, readme_path))
     
-    # If chapters directory exists, process it
-    if chapters_dir.exists() and chapters_dir.is_dir():
-        # Get all chapter directories sorted numerically
-        chapter_dirs = sorted([d for d in chapters_dir.iterdir() if d.is_dir() and not is_excluded(d, exclude)])
-        
-        for chapter_dir in chapter_dirs:
+    # If chapters directory exists, process it in a single os.walk
+    if chapters_dir.is_dir():
+        chapters_path = str(chapters_dir)
+        for dirpath, dirnames, filenames in os.walk(chapters_path, followlinks=True):
+            if dirpath == chapters_path:
+                # Prune excluded chapter directories before os.walk descends into
+                # them, and sort the rest so chapters are visited numerically
+                dirnames[:] = sorted(d for d in dirnames
+                                     if not is_excluded(os.path.join(dirpath, d), exclude))
+                continue
+            
+            # Sections live directly in the chapter directory; don't descend further
+            dirnames[:] = []
+            
+            md_files = sorted(os.path.join(dirpath, f) for f in filenames
+                              if f.endswith('.md') and f != 'README.md'
+                              and not is_excluded(os.path.join(dirpath, f), exclude))
+            
             # Find the README.md or main chapter file
-            chapter_readme = chapter_dir / 'README.md'
-            if chapter_readme.exists():
-                chapter_title = extract_title(chapter_readme)
-                chapter_path = chapter_readme.relative_to(book_root)
-                content.append(f"* [{chapter_title}]({chapter_path})\n")
-                
-                # Find all markdown files in this chapter directory, excluding README.md
-                section_files = sorted([f for f in chapter_dir.glob('*.md') 
-                                       if f.name != 'README.md' and not is_excluded(f, exclude)])
-                
-                for section_file in section_files:
-                    section_title = extract_title(section_file)
-                    section_path = section_file.relative_to(book_root)
-                    content.append(f"  * [{section_title}]({section_path})\n")
-            else:
-                # If no README.md, use all markdown files as sections
-                md_files = sorted([f for f in chapter_dir.glob('*.md') if not is_excluded(f, exclude)])
-                if md_files:
-                    # Use the directory name as the chapter title
-                    chapter_title = chapter_dir.name.replace('-', ' ').title()
-                    content.append(f"* [{chapter_title}]\n")
-                    
-                    for md_file in md_files:
-                        section_title = extract_title(md_file)
-                        section_path = md_file.relative_to(book_root)
-                        content.append(f"  * [{section_title}]({section_path})\n")
+            if 'README.md' in filenames:
+                entries.append(("", None, os.path.join(dirpath, 'README.md')))
+            elif md_files:
+                # If no README.md, use the directory name as the chapter title
+                chapter_title = os.path.basename(dirpath).replace('-', ' ').title()
+                entries.append(("", chapter_title, None))
+            
+            entries.extend(("  ", None, md_file) for md_file in md_files)
     else:
         # If no chapters directory, just find all markdown files in the root
-        md_files = sorted([f for f in book_root.glob('*.md') 
-                           if f.name != 'README.md' and f.name != 'SUMMARY.md' and not is_excluded(f, exclude)])
-        
-        for md_file in md_files:
-            title = extract_title(md_file)
-            path = md_file.relative_to(book_root)
-            content.append(f"* [{title}]({path})\n")
+        md_files = list_markdown_files(book_root, exclude, skip=('README.md', 'SUMMARY.md'))
+        entries.extend(("", None, md_file) for md_file in md_files)
+    
+    # Title extraction is I/O-bound, so read all files concurrently
+    paths = [path for _, title, path in entries if title is None]
+    with ThreadPoolExecutor() as executor:
+        titles = dict(zip(paths, executor.map(extract_title, paths)))
+    
+    # Second pass: emit the lines in the order they were collected
+    content = ["# Summary\n\n"]
+    for indent, title, path in entries:
+        if path is None:
+            content.append(f"{indent}* [{title}]\n")
+        else:
+            if title is None:
+                title = titles[path]
+            content.append(f"{indent}* [{title}]({relative_path(path, root_prefix)})\n")
     
     # Write the content to the SUMMARY.md file
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(content)
+        f.write(''.join(content))
     
     print(f"Successfully generated {output_file}")
     return content
@@ -114,7 +159,7 @@ def main():
     
     args = parser.parse_args()
     
-    book_root = Path(args.book_root).resolve()
+    book_root = Path(os.path.abspath(args.book_root))
     output_file = book_root / args.output
     
     generate_summary(book_root, output_file, args.exclude)
@@ -11,7 +11,135 @@ import argparse
 from datetime import datetime
 from pathlib import Path
 
-def organize_pdf(pdf_path, output_dir="./published_pdfs", add_version=True):
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request number for cloning a file's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+TRANSFER_MODES = ('link', 'reflink', 'copy')
+
+def version_counter_path(month_dir, book_title, date_str):
+    """Return the counter file holding the last used version for a book and date."""
+    return month_dir / f".{book_title}_{date_str}.count"
+
+def next_version(month_dir, book_title, date_str):
+    """
+    Return the next version number for a book's PDF on a given date.
+    
+    The last used version is kept in a small counter file next to the PDFs so
+    the month directory doesn't have to be rescanned on every run.
+    """
+    try:
+        return int(version_counter_path(month_dir, book_title, date_str).read_text(encoding='utf-8')) + 1
+    except (OSError, ValueError):
+        # Missing or corrupt counter: count existing PDFs for this date instead
+        return sum(1 for _ in month_dir.glob(f"{book_title}_{date_str}*.pdf")) + 1
+
+def save_version(month_dir, book_title, date_str, version):
+    """Atomically record version as the last used one for a book and date."""
+    counter_path = version_counter_path(month_dir, book_title, date_str)
+    tmp_path = counter_path.with_name(counter_path.name + '.tmp')
+    tmp_path.write_text(str(version), encoding='utf-8')
+    os.replace(tmp_path, counter_path)
+
+def copy_file(src, dst):
+    """
+    Copy src to dst like shutil.copy2, keeping the data copy in the kernel
+    with os.copy_file_range where the platform and filesystem support it.
+    """
+    # Opening dst for writing would truncate src if they share an inode
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    if not hasattr(os, 'copy_file_range'):
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        complete = remaining == 0
+    except OSError:
+        complete = False
+    
+    if not complete:
+        # Unsupported filesystem, cross-device copy on older kernels, or the
+        # kernel stopped short of the full size: redo the copy in userspace
+        shutil.copy2(src, dst)
+        return
+    
+    shutil.copystat(src, dst)
+
+def reflink_file(src, dst):
+    """Clone src into dst with the FICLONE ioctl, raising OSError if unsupported."""
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+def place_file(src, dst, mode):
+    """
+    Create dst from src using the cheapest method allowed by mode.
+    
+    'link' tries a hardlink first, 'reflink' a copy-on-write clone, and both
+    fall back down the chain to a regular copy when the filesystem refuses.
+    dst must not exist yet.
+    """
+    if mode == 'link':
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    
+    if mode in ('link', 'reflink'):
+        try:
+            reflink_file(src, dst)
+            return
+        except OSError:
+            pass
+    
+    copy_file(src, dst)
+
+def transfer_file(src, dst, mode='reflink'):
+    """
+    Place src at dst with place_file, without ever writing into an existing dst.
+    
+    The file is built under a temporary name next to dst and renamed over it,
+    so an existing archive that shares its inode with src is never truncated.
+    Returns False without touching anything when dst already is src (e.g. a
+    hardlink from an earlier run), True once dst has been written.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return False
+    
+    tmp_path = os.path.join(os.path.dirname(dst), f".{os.path.basename(dst)}.tmp")
+    # A leftover from an interrupted run may itself be a hardlink to src;
+    # unlinking it is safe, writing into it is not
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    
+    try:
+        place_file(src, tmp_path, mode)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    return True
+
+def organize_pdf(pdf_path, output_dir="./published_pdfs", add_version=True, mode='reflink'):
     """
     Organize the generated PDF by date.
     
@@ -19,9 +147,10 @@ def organize_pdf(pdf_path, output_dir="./published_pdfs", add_version=True):
         pdf_path: Path to the generated PDF
         output_dir: Directory to store organized PDFs
         add_version: Whether to add version number to filename
+        mode: How to place the PDF in the archive: 'link', 'reflink' or 'copy'
     """
-    pdf_path = Path(pdf_path).resolve()
-    output_dir = Path(output_dir).resolve()
+    pdf_path = Path(os.path.abspath(pdf_path))
+    output_dir = Path(os.path.abspath(output_dir))
     
     # Create output directory if it doesn't exist
     current_date = datetime.now()
@@ -39,16 +168,21 @@ def organize_pdf(pdf_path, output_dir="./published_pdfs", add_version=True):
     # Get version number if requested
     version = ""
     if add_version:
-        # Count existing PDFs in this month's directory with this date
-        existing_files = list(month_dir.glob(f"{book_title}_{date_str}*.pdf"))
-        version = f"_v{len(existing_files) + 1}"
+        version_number = next_version(month_dir, book_title, date_str)
+        version = f"_v{version_number}"
     
     # Create new filename
     new_filename = f"{book_title}_{date_str}{version}.pdf"
     new_path = month_dir / new_filename
     
-    # Copy PDF to new location
-    shutil.copy2(pdf_path, new_path)
+    # Link, clone or copy PDF to new location
+    if not transfer_file(pdf_path, new_path, mode):
+        print(f"PDF already organized: {new_path}")
+        return new_path
+    
+    # Only claim the version once the PDF is actually in place
+    if add_version:
+        save_version(month_dir, book_title, date_str, version_number)
     
     print(f"PDF organized: {new_path}")
     return new_path
@@ -60,10 +194,13 @@ def main():
                         help='Directory to store organized PDFs')
     parser.add_argument('--no-version', action='store_true',
                         help='Do not add version number to filename')
+    parser.add_argument('--mode', choices=TRANSFER_MODES, default='reflink',
+                        help='How to store the PDF: hardlink, copy-on-write clone or full copy; '
+                             'falls back to a copy when unsupported (default: reflink)')
     
     args = parser.parse_args()
     
-    organize_pdf(args.pdf_path, args.output_dir, not args.no_version)
+    organize_pdf(args.pdf_path, args.output_dir, not args.no_version, args.mode)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file